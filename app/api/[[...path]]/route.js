@@ -7,6 +7,7 @@ import {
   FESTIVAL_CALENDAR, 
   generateFestivalBundle, 
   getUpcomingFestivals,
+  getShopDate,
   generateHyperlocalAlerts,
   matchProductsForFestival 
 } from '@/lib/festivals'
@@ -62,6 +63,12 @@ const DEMO_ORDERS = [
   { id: 'o3', customerName: 'Sunita Devi', items: [{ productId: 'p2', quantity: 1, price: 250 }, { productId: 'p5', quantity: 2, price: 85 }], total: 420, status: 'completed', paymentMethod: 'UPI', createdAt: new Date() }
 ]
 
+// Optional simulated date (e.g. ?date=2024-10-31) for festival computations
+function getRequestDate(value, fallback = new Date()) {
+  const date = value ? new Date(value) : fallback
+  return isNaN(date.getTime()) ? fallback : date
+}
+
 export async function GET(request) {
   const { pathname, searchParams } = new URL(request.url)
   const pathSegments = pathname.split('/').filter(Boolean).slice(1) // Remove 'api'
@@ -207,7 +214,7 @@ export async function GET(request) {
       if (pathSegments[1] === 'upcoming') {
         return NextResponse.json({
           success: true,
-          festivals: getUpcomingFestivals()
+          festivals: getUpcomingFestivals(getRequestDate(searchParams.get('date'), getShopDate(DEMO_SHOP.timezone)))
         }, { headers: corsHeaders })
       }
 
@@ -215,7 +222,7 @@ export async function GET(request) {
         const festival = searchParams.get('festival') || 'diwali'
         const bundleType = parseInt(searchParams.get('type') || '0')
         
-        const bundle = generateFestivalBundle(festival, DEMO_PRODUCTS, bundleType)
+        const bundle = generateFestivalBundle(festival, DEMO_PRODUCTS, bundleType, getRequestDate(searchParams.get('date')))
         
         return NextResponse.json({
           success: true,
@@ -483,9 +490,9 @@ export async function POST(request) {
 
     // Festival Bundle Creation
     if (pathSegments[0] === 'festivals' && pathSegments[1] === 'create-bundle') {
-      const { festival, products, customName, customDiscount } = body
+      const { festival, products, customName, customDiscount, date } = body
       
-      const bundle = generateFestivalBundle(festival, products, 0)
+      const bundle = generateFestivalBundle(festival, products, 0, getRequestDate(date))
       if (customName) bundle.name = customName
       if (customDiscount) bundle.discount = customDiscount
       
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+SmartLocal Suite Festival & Demand Radar Benchmark
+Sweeps simulated dates across a year and many shop catalogues through the
+festival calendar endpoints, measuring latency, payload size and result stability.
+"""
+
+import requests
+import json
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import statistics
+from datetime import date, datetime, timedelta
+
+from backend_test import API_BASE, REPO_ROOT, ResultCache, dependency_fingerprint, select_affected
+
+BENCHMARK_CACHE_FILE = os.path.join(REPO_ROOT, ".backend_benchmark_cache.json")
+
+# The benchmark reuses backend_test.py's selection and fingerprint code
+RUNNER_FILES = [os.path.basename(__file__), 'backend_test.py']
+
+# Route branches and lib/* modules each scenario exercises, in run order
+BENCHMARK_DEPENDENCIES = {
+    'demand_radar': {'routes': ['GET demand-radar'], 'libs': ['lib/festivals.js']},
+    'festivals_upcoming': {'routes': ['GET festivals'], 'libs': ['lib/festivals.js']},
+    'festival_bundles': {'routes': ['GET festivals'], 'libs': ['lib/festivals.js']},
+    'create_bundle': {'routes': ['POST festivals'], 'libs': ['lib/festivals.js']},
+}
+
+# Only create-bundle takes a shop catalogue; the GET endpoints serve the demo shop
+PER_SHOP_SCENARIOS = {'create_bundle'}
+
+# The demand radar ignores the date, so it is measured on a single date
+DATE_INDEPENDENT_SCENARIOS = {'demand_radar'}
+
+FESTIVALS = ['diwali', 'holi', 'eid', 'ramzan', 'pongal', 'navratri']
+
+MONTHS = ['january', 'february', 'march', 'april', 'may', 'june',
+          'july', 'august', 'september', 'october', 'november', 'december']
+
+UPCOMING_WINDOW_DAYS = 30
+
+# Bundle ids embed the creation time; ignored when comparing repeats
+VOLATILE_FIELDS = {'id'}
+
+# Names cover the festival keywords in lib/festivals.js plus everyday staples
+PRODUCT_POOL = [
+    ('Kaju Katli Sweets 500g', 'Sweets', 450),
+    ('Traditional Sweets Box', 'Sweets', 380),
+    ('Dry Fruits Mix 250g', 'Dry Fruits', 320),
+    ('Medjool Dates 500g', 'Dry Fruits', 420),
+    ('Cashews 250g', 'Dry Fruits', 290),
+    ('Golden Raisins 250g', 'Dry Fruits', 140),
+    ('Mixed Nuts 200g', 'Dry Fruits', 260),
+    ('Sunflower Oil 1L', 'Oil', 130),
+    ('Basmati Rice 1kg', 'Grains', 180),
+    ('Wheat Flour (Atta) 5kg', 'Grains', 250),
+    ('Buckwheat Flour 500g', 'Grains', 110),
+    ('Water Chestnut Flour 500g', 'Grains', 140),
+    ('Toor Dal Lentils 1kg', 'Pulses', 160),
+    ('Clay Diyas Pack of 12', 'Puja', 60),
+    ('Decorative Rangoli Kit', 'Decor', 150),
+    ('Herbal Holi Colors 500g', 'Festive', 120),
+    ('Namkeen Snacks 400g', 'Snacks', 90),
+    ('Mango Beverages 1L', 'Beverages', 99),
+    ('Mutton Meat 1kg', 'Meat', 750),
+    ('Roasted Vermicelli 400g', 'Grocery', 55),
+    ('Garam Masala Spices 100g', 'Spices', 75),
+    ('Organic Jaggery 1kg', 'Grocery', 95),
+    ('Coconut Whole', 'Grocery', 40),
+    ('Desi Ghee 500ml', 'Dairy', 330),
+    ('Toned Milk 1L', 'Dairy', 60),
+    ('Seasonal Fruits Basket', 'Fruits', 250),
+    ('Rock Salt 1kg', 'Grocery', 45),
+    ('Tea Powder 250g', 'Beverages', 120),
+    ('Biscuits Pack', 'Snacks', 25),
+    ('Sugar 1kg', 'Grocery', 60),
+]
+
+
+def normalize_payload(value):
+    """Drop volatile fields so repeated responses compare equal"""
+    if isinstance(value, dict):
+        return {k: normalize_payload(v) for k, v in value.items() if k not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [normalize_payload(v) for v in value]
+    return value
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def expected_days_until(period, day):
+    """Days from `day` until a festival period starts (0 inside it), None for lunar periods"""
+    names = [m.strip() for m in period.lower().split('-')]
+    if any(m not in MONTHS for m in names):
+        return None
+
+    first, last = MONTHS.index(names[0]), MONTHS.index(names[-1])
+    month = day.month - 1
+    in_period = first <= month <= last if first <= last else (month >= first or month <= last)
+    if in_period:
+        return 0
+    start = date(day.year + (1 if month > first else 0), first + 1, 1)
+    return (start - day).days
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+
+def scenario_label(name):
+    """Scenario name, flagged when its endpoint ignores the simulated date"""
+    return f"{name} (date-independent)" if name in DATE_INDEPENDENT_SCENARIOS else name
+
+
+def summarize(result):
+    """Latency, payload and stability figures for one scenario run"""
+    latencies = result['latencies']
+    sizes = result['sizes']
+    summary = {
+        'requests': len(latencies),
+        'dates': result['dates'],
+        'shops': result['shops'],
+        'errors': result['errors'],
+        'unstable': result['unstable'],
+        'date_mismatches': result['date_mismatches'],
+    }
+    if latencies:
+        summary.update({
+            'p50_ms': round(percentile(latencies, 50), 1),
+            'p95_ms': round(percentile(latencies, 95), 1),
+            'max_ms': round(max(latencies), 1),
+            'mean_bytes': round(statistics.mean(sizes)),
+            'max_bytes': max(sizes),
+        })
+    return summary
+
+
+class FestivalBenchmark:
+    def __init__(self, shops=20, year=None, days_step=7, repeat=2):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+        self.shops = max(1, shops)
+        self.repeat = max(1, repeat)
+        self.dates = self.simulated_dates(year or date.today().year, max(1, days_step))
+        self.catalogues = [self.build_catalogue(i) for i in range(self.shops)]
+        self.results = {}
+        self.skipped = []
+
+    @staticmethod
+    def simulated_dates(year, days_step):
+        """Every `days_step` days from January 1st through December 31st"""
+        day = date(year, 1, 1)
+        dates = []
+        while day.year == year:
+            dates.append(day)
+            day += timedelta(days=days_step)
+        return dates
+
+    @staticmethod
+    def build_catalogue(shop_index):
+        """Deterministic catalogue of 8-30 products with shop-specific prices"""
+        rng = random.Random(shop_index)
+        picks = rng.sample(PRODUCT_POOL, rng.randint(8, len(PRODUCT_POOL)))
+        return [{
+            'id': f"s{shop_index}-p{i}",
+            'name': name,
+            'category': category,
+            'price': round(price * rng.uniform(0.9, 1.15)),
+            'stock': rng.randint(0, 80),
+            'unit': 'pack'
+        } for i, (name, category, price) in enumerate(picks)]
+
+    def build_request(self, name, shop_index, day_index, day):
+        """Return (method, path, request kwargs) for one shop opening the app on `day`"""
+        festival = FESTIVALS[(shop_index + day_index) % len(FESTIVALS)]
+
+        if name == 'demand_radar':
+            return 'GET', 'demand-radar', {}
+        if name == 'festivals_upcoming':
+            return 'GET', 'festivals/upcoming', {'params': {'date': day.isoformat()}}
+        if name == 'festival_bundles':
+            params = {'festival': festival, 'type': day_index % 3, 'date': day.isoformat()}
+            return 'GET', 'festivals/bundles', {'params': params}
+        if name == 'create_bundle':
+            body = {'festival': festival, 'products': self.catalogues[shop_index], 'date': day.isoformat()}
+            return 'POST', 'festivals/create-bundle', {'json': body}
+        raise ValueError(f"Unknown scenario: {name}")
+
+    @staticmethod
+    def date_mismatch(name, data, day):
+        """Check that date-derived fields follow the simulated date"""
+        if name == 'festivals_upcoming':
+            festivals = data.get('festivals') or []
+            for festival in festivals:
+                days_until = expected_days_until(festival.get('period', ''), day)
+                if festival.get('daysUntil') != days_until:
+                    return True
+                if festival.get('isUpcoming') != (days_until is not None and days_until <= UPCOMING_WINDOW_DAYS):
+                    return True
+            order = [f['daysUntil'] if f['daysUntil'] is not None else math.inf for f in festivals]
+            return order != sorted(order)
+        if name in ('festival_bundles', 'create_bundle') and data.get('bundle'):
+            valid_until = f"{(day + timedelta(days=30)).isoformat()}T00:00:00.000Z"
+            return data['bundle'].get('validUntil') != valid_until
+        return False
+
+    def run_scenario(self, name):
+        """Sweep every shop and simulated date through one endpoint"""
+        shops = self.shops if name in PER_SHOP_SCENARIOS else 1
+        dates = self.dates[:1] if name in DATE_INDEPENDENT_SCENARIOS else self.dates
+        result = {'latencies': [], 'sizes': [], 'dates': len(dates), 'shops': shops,
+                  'errors': 0, 'unstable': 0, 'date_mismatches': 0}
+        self.results[name] = result
+
+        for shop_index in range(shops):
+            for day_index, day in enumerate(dates):
+                method, path, kwargs = self.build_request(name, shop_index, day_index, day)
+                payloads = []
+
+                for _ in range(self.repeat):
+                    try:
+                        start = time.perf_counter()
+                        response = self.session.request(method, f"{API_BASE}/{path}", **kwargs)
+                        result['latencies'].append((time.perf_counter() - start) * 1000)
+                        result['sizes'].append(len(response.content))
+                        if response.status_code != 200:
+                            result['errors'] += 1
+                            break
+                        payloads.append(response.json())
+                    except Exception:
+                        result['errors'] += 1
+                        break
+
+                if not payloads:
+                    continue
+                baseline = normalize_payload(payloads[0])
+                if any(normalize_payload(p) != baseline for p in payloads[1:]):
+                    result['unstable'] += 1
+                if self.date_mismatch(name, payloads[0], day):
+                    result['date_mismatches'] += 1
+
+        return result['errors'] == 0 and result['unstable'] == 0 and result['date_mismatches'] == 0
+
+    def scenario_fingerprint(self, name):
+        """Dependency fingerprint plus the sweep configuration and runner sources"""
+        config = json.dumps({'shops': self.shops, 'dates': [d.isoformat() for d in self.dates],
+                             'repeat': self.repeat})
+        runners = ""
+        for runner in RUNNER_FILES:
+            with open(os.path.join(REPO_ROOT, runner), encoding='utf-8') as f:
+                runners += f.read()
+        return dependency_fingerprint(BENCHMARK_DEPENDENCIES[name], config + runners)
+
+    def run_all(self, only=None, cache=None):
+        """Run all benchmark scenarios, or only those named in `only`"""
+        print("🚀 Starting SmartLocal Suite Festival Benchmark")
+        print(f"📍 Benchmarking against: {API_BASE}")
+        print(f"🗓️ {len(self.dates)} simulated dates x {self.repeat} repeats; "
+              f"{self.shops} shop catalogues for {', '.join(sorted(PER_SHOP_SCENARIOS))}")
+        print("=" * 60)
+
+        passed = True
+        for name in BENCHMARK_DEPENDENCIES:
+            if only is not None and name not in only:
+                continue
+
+            fingerprint = None
+            if cache is not None:
+                fingerprint = self.scenario_fingerprint(name)
+                if cache.is_fresh(name, fingerprint):
+                    self.skipped.append(name)
+                    self.print_summary(f"⏭️ CACHED {scenario_label(name)} (unchanged since last stable run)",
+                                       cache.cached_result(name) or {})
+                    continue
+
+            started = datetime.now()
+            print(f"⏱️ Running {name}...")
+            success = self.run_scenario(name)
+            summary = summarize(self.results[name])
+            elapsed = (datetime.now() - started).total_seconds()
+            status = "✅ STABLE" if success else "❌ UNSTABLE"
+            self.print_summary(f"{status} {scenario_label(name)} ({elapsed:.1f}s)", summary)
+            passed = passed and success
+
+            if cache is not None:
+                cache.record(name, fingerprint, success, summary)
+
+        if cache is not None:
+            cache.save()
+
+        print("=" * 60)
+        print(f"⏭️ Skipped (cached): {len(self.skipped)}")
+        print("=" * 60)
+        return passed
+
+    def print_summary(self, heading, summary):
+        """Print latency, payload and stability figures for one scenario"""
+        print(heading)
+        if 'p50_ms' in summary:
+            print(f"    Requests: {summary['requests']} "
+                  f"({summary['dates']} dates x {summary['shops']} shops x {self.repeat} repeats), "
+                  f"Latency ms p50/p95/max: {summary['p50_ms']}/{summary['p95_ms']}/{summary['max_ms']}")
+            print(f"    Payload bytes mean/max: {summary['mean_bytes']}/{summary['max_bytes']}")
+        if summary:
+            print(f"    Errors: {summary['errors']}, Unstable repeats: {summary['unstable']}, "
+                  f"Date mismatches: {summary['date_mismatches']}")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Festival calendar and demand radar benchmark")
+    parser.add_argument('--shops', type=positive_int, default=20, help="number of simulated shops")
+    parser.add_argument('--year', type=int, help="year to sweep (default: current year)")
+    parser.add_argument('--days-step', type=positive_int, default=7, help="days between simulated dates")
+    parser.add_argument('--repeat', type=positive_int, default=2, help="calls per scenario for stability checks")
+    parser.add_argument('--changed-since', metavar='GIT_REV',
+                        help="only run scenarios affected by changes since this git revision")
+    parser.add_argument('--cached', action='store_true',
+                        help="skip scenarios that were stable before and whose dependencies are unchanged")
+    args = parser.parse_args()
+
+    only = None
+    if args.changed_since:
+        only = select_affected(BENCHMARK_DEPENDENCIES, args.changed_since, RUNNER_FILES)
+        print(f"🔎 {len(only)}/{len(BENCHMARK_DEPENDENCIES)} scenarios affected since {args.changed_since}: "
+              f"{', '.join(only) or 'none'}")
+
+    benchmark = FestivalBenchmark(shops=args.shops, year=args.year,
+                                  days_step=args.days_step, repeat=args.repeat)
+    success = benchmark.run_all(only=only, cache=ResultCache(BENCHMARK_CACHE_FILE) if args.cached else None)
+
+    # Exit with appropriate code
+    sys.exit(0 if success else 1)
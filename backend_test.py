@@ -7,6 +7,11 @@ Tests all critical backend endpoints for the SmartLocal Suite application.
 import requests
 import json
 import os
+import re
+import hashlib
+import inspect
+import argparse
+import subprocess
 from datetime import datetime
 import sys
 
@@ -14,6 +19,232 @@ import sys
 BASE_URL = "http://localhost:3000"
 API_BASE = f"{BASE_URL}/api"
 
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+ROUTE_FILE = "app/api/[[...path]]/route.js"
+RESULT_CACHE_FILE = os.path.join(REPO_ROOT, ".backend_test_cache.json")
+
+# Build, dependency and environment files that can break every route
+GLOBAL_FILES = ['package.json', 'yarn.lock', 'package-lock.json', 'next.config.js',
+                'jsconfig.json', '.env']
+
+# Route branches ("METHOD segment") and lib/* modules exercised by each check,
+# in run order. "*" means the check depends on the whole route file, including
+# every lib/* module it imports.
+TEST_DEPENDENCIES = {
+    'test_authentication': {'routes': ['GET auth'], 'libs': ['lib/auth.js']},
+    'test_shop_data': {'routes': ['GET shop'], 'libs': []},
+    'test_products_api': {'routes': ['GET products', 'POST products', 'PUT products', 'DELETE products'], 'libs': []},
+    'test_orders_api': {'routes': ['GET orders', 'POST orders'], 'libs': []},
+    'test_analytics_api': {'routes': ['GET analytics'], 'libs': []},
+    'test_dynamic_pricing': {'routes': ['GET pricing'], 'libs': ['lib/utils.js']},
+    'test_voice_parsing': {'routes': ['GET voice'], 'libs': ['lib/utils.js']},
+    'test_festival_bundles': {'routes': ['GET bundles'], 'libs': ['lib/utils.js']},
+    'test_cash_session': {'routes': ['GET cash-session'], 'libs': ['lib/cashSession.js']},
+    'test_placeholder_images': {'routes': ['GET placeholder'], 'libs': []},
+    'test_cors_headers': {'routes': [], 'libs': []},
+    'test_error_handling': {'routes': ['*'], 'libs': []},
+}
+
+HANDLER_RE = re.compile(r"^export async function (GET|POST|PUT|DELETE|OPTIONS)\b")
+BRANCH_RE = re.compile(r"^    if \(pathSegments\[0\] === ")
+SEGMENT_RE = re.compile(r"pathSegments\[0\] === '([^']+)'")
+LIB_IMPORT_RE = re.compile(r"from ['\"]\./([\w-]+)['\"]")
+ROUTE_IMPORT_RE = re.compile(r"from ['\"]@/lib/([\w-]+)['\"]")
+HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", re.M)
+
+
+def read_repo_file(path):
+    """Read a repo-relative file, returning '' if it does not exist"""
+    try:
+        with open(os.path.join(REPO_ROOT, path), encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+
+def parse_route_branches(source):
+    """Map each top-level route branch key to its (start, end) line ranges"""
+    branches = {}
+    method = None
+    current = None
+
+    for lineno, line in enumerate(source.splitlines(), 1):
+        handler = HANDLER_RE.match(line)
+        if handler:
+            method = handler.group(1)
+            current = None
+        elif current is None and method and BRANCH_RE.match(line):
+            keys = [f"{method} {segment}" for segment in SEGMENT_RE.findall(line)]
+            current = (keys, lineno)
+        elif current is not None and line == "    }":
+            keys, start = current
+            for key in keys:
+                branches.setdefault(key, []).append((start, lineno))
+            current = None
+
+    return branches
+
+
+def route_keys_for_lines(source, line_numbers):
+    """Return the branch keys covering the given lines; '*' marks shared code"""
+    line_to_keys = {}
+    for key, ranges in parse_route_branches(source).items():
+        for start, end in ranges:
+            for lineno in range(start, end + 1):
+                line_to_keys.setdefault(lineno, set()).add(key)
+
+    keys = set()
+    for lineno in line_numbers:
+        keys.update(line_to_keys.get(lineno, {'*'}))
+    return keys
+
+
+def resolve_libs(libs):
+    """Expand lib/* modules with the sibling lib modules they import"""
+    resolved = set()
+    pending = list(libs)
+
+    while pending:
+        lib = pending.pop()
+        if lib in resolved:
+            continue
+        resolved.add(lib)
+        for name in LIB_IMPORT_RE.findall(read_repo_file(lib)):
+            pending.append(f"lib/{name}.js")
+
+    return sorted(resolved)
+
+
+def route_libs():
+    """lib/* modules imported by the route file (and thus loaded by every route)"""
+    return resolve_libs(f"lib/{name}.js" for name in ROUTE_IMPORT_RE.findall(read_repo_file(ROUTE_FILE)))
+
+
+def dependency_libs(dependencies):
+    """All lib/* modules a check depends on, including route imports for '*'"""
+    libs = list(dependencies['libs'])
+    if '*' in dependencies['routes']:
+        libs.extend(route_libs())
+    return resolve_libs(libs)
+
+
+def dependency_fingerprint(dependencies, extra=""):
+    """Hash the route branches, lib modules and check source a scenario depends on"""
+    source = read_repo_file(ROUTE_FILE)
+    lines = source.splitlines()
+    branches = parse_route_branches(source)
+    digest = hashlib.sha256(extra.encode('utf-8'))
+
+    if '*' in dependencies['routes']:
+        digest.update(source.encode('utf-8'))
+    else:
+        branch_lines = {lineno for ranges in branches.values()
+                        for start, end in ranges for lineno in range(start, end + 1)}
+        shared = [line for lineno, line in enumerate(lines, 1) if lineno not in branch_lines]
+        digest.update("\n".join(shared).encode('utf-8'))
+        for key in sorted(dependencies['routes']):
+            for start, end in branches.get(key, []):
+                digest.update(key.encode('utf-8'))
+                digest.update("\n".join(lines[start - 1:end]).encode('utf-8'))
+
+    for path in dependency_libs(dependencies) + GLOBAL_FILES:
+        digest.update(path.encode('utf-8'))
+        digest.update(read_repo_file(path).encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def git(*args):
+    """Run a git command in the repo root and return its stdout"""
+    result = subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def changed_since(rev):
+    """Return (changed files, touched route branch keys) between rev and the working tree"""
+    changed_files = set(git('diff', '--name-only', rev).split())
+    route_keys = set()
+
+    if ROUTE_FILE in changed_files:
+        try:
+            old_source = git('show', f"{rev}:{ROUTE_FILE}")
+        except RuntimeError:
+            old_source = ""
+
+        # Map removed lines onto the old file's branches and added lines onto
+        # the new file's, so renamed or deleted branches still count
+        old_lines, new_lines = set(), set()
+        for hunk in HUNK_RE.finditer(git('diff', '-U0', rev, '--', ROUTE_FILE)):
+            old_start, old_count, new_start, new_count = hunk.groups()
+            old_start, new_start = int(old_start), int(new_start)
+            old_lines.update(range(old_start, old_start + int(old_count or 1)))
+            new_lines.update(range(new_start, new_start + int(new_count or 1)))
+
+        route_keys = (route_keys_for_lines(old_source, old_lines) |
+                      route_keys_for_lines(read_repo_file(ROUTE_FILE), new_lines))
+
+    return changed_files, route_keys
+
+
+def select_affected(dependency_map, rev, runner_files):
+    """Names in dependency_map whose route branches or lib modules changed since rev"""
+    changed_files, route_keys = changed_since(rev)
+
+    # Shared route code, global config or the runner itself changed: everything is affected
+    if '*' in route_keys or changed_files.intersection(GLOBAL_FILES + list(runner_files)):
+        return list(dependency_map)
+
+    selected = []
+    for name, dependencies in dependency_map.items():
+        routes = set(dependencies['routes'])
+        route_hit = (routes & route_keys) or ('*' in routes and ROUTE_FILE in changed_files)
+        lib_hit = changed_files.intersection(dependency_libs(dependencies))
+        if route_hit or lib_hit:
+            selected.append(name)
+    return selected
+
+
+class ResultCache:
+    """Index of scenarios that passed, with their dependency fingerprint and results"""
+
+    def __init__(self, path=RESULT_CACHE_FILE):
+        self.path = path
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def is_fresh(self, name, fingerprint):
+        """Check whether a scenario passed with this exact fingerprint"""
+        entry = self.entries.get(name)
+        return isinstance(entry, dict) and entry.get('fingerprint') == fingerprint
+
+    def cached_result(self, name):
+        """Results stored with the last pass of a scenario, if any"""
+        entry = self.entries.get(name)
+        return entry.get('result') if isinstance(entry, dict) else None
+
+    def record(self, name, fingerprint, success, result=None):
+        """Remember a pass, or forget the scenario after a failure"""
+        if success:
+            self.entries[name] = {'fingerprint': fingerprint, 'result': result}
+        else:
+            self.entries.pop(name, None)
+
+    def save(self):
+        """Write the index back to disk"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+
+def check_methods(cls):
+    """Names of the test_* methods defined on a tester class"""
+    return [name for name in dir(cls) if name.startswith('test_') and callable(getattr(cls, name))]
+
+
 class SmartLocalAPITester:
     def __init__(self):
         self.session = requests.Session()
@@ -23,6 +254,7 @@ class SmartLocalAPITester:
         })
         self.test_results = []
         self.failed_tests = []
+        self.skipped_tests = []
         
     def log_test(self, test_name, success, details="", response_data=None):
         """Log test results"""
@@ -628,25 +860,38 @@ class SmartLocalAPITester:
         except Exception as e:
             self.log_test("Error Handling - 404", False, f"Exception: {str(e)}")
 
-    def run_all_tests(self):
-        """Run all backend API tests"""
+    def run_all_tests(self, only=None, cache=None):
+        """Run all backend API tests, or only those named in `only`"""
         print("🚀 Starting SmartLocal Suite Backend API Tests")
         print(f"📍 Testing against: {API_BASE}")
         print("=" * 60)
+
+        unmapped = set(check_methods(SmartLocalAPITester)) ^ set(TEST_DEPENDENCIES)
+        if unmapped:
+            raise RuntimeError(f"test_* methods and TEST_DEPENDENCIES differ: {sorted(unmapped)}")
         
-        # Run all test methods
-        self.test_authentication()
-        self.test_shop_data()
-        self.test_products_api()
-        self.test_orders_api()
-        self.test_analytics_api()
-        self.test_dynamic_pricing()
-        self.test_voice_parsing()
-        self.test_festival_bundles()
-        self.test_cash_session()
-        self.test_placeholder_images()
-        self.test_cors_headers()
-        self.test_error_handling()
+        # Run the selected test methods, skipping ones cached as passing
+        for name in TEST_DEPENDENCIES:
+            if only is not None and name not in only:
+                continue
+
+            fingerprint = None
+            if cache is not None:
+                method_source = inspect.getsource(getattr(self, name))
+                fingerprint = dependency_fingerprint(TEST_DEPENDENCIES[name], method_source)
+                if cache.is_fresh(name, fingerprint):
+                    print(f"⏭️ SKIP {name} (unchanged since last pass)\n")
+                    self.skipped_tests.append(name)
+                    continue
+
+            failures_before = len(self.failed_tests)
+            getattr(self, name)()
+
+            if cache is not None:
+                cache.record(name, fingerprint, len(self.failed_tests) == failures_before)
+
+        if cache is not None:
+            cache.save()
         
         # Print summary
         print("=" * 60)
@@ -660,7 +905,9 @@ class SmartLocalAPITester:
         print(f"Total Tests: {total_tests}")
         print(f"✅ Passed: {passed_tests}")
         print(f"❌ Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        print(f"⏭️ Skipped (cached): {len(self.skipped_tests)}")
+        if total_tests:
+            print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
         
         if self.failed_tests:
             print("\n❌ FAILED TESTS:")
@@ -673,8 +920,21 @@ class SmartLocalAPITester:
         return failed_tests == 0
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SmartLocal Suite backend API tests")
+    parser.add_argument('--changed-since', metavar='GIT_REV',
+                        help="only run checks affected by changes since this git revision")
+    parser.add_argument('--cached', action='store_true',
+                        help="skip checks that passed before and whose dependencies are unchanged")
+    args = parser.parse_args()
+
+    only = None
+    if args.changed_since:
+        only = select_affected(TEST_DEPENDENCIES, args.changed_since, [os.path.basename(__file__)])
+        print(f"🔎 {len(only)}/{len(TEST_DEPENDENCIES)} checks affected since {args.changed_since}: "
+              f"{', '.join(only) or 'none'}")
+
     tester = SmartLocalAPITester()
-    success = tester.run_all_tests()
+    success = tester.run_all_tests(only=only, cache=ResultCache() if args.cached else None)
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -250,7 +250,7 @@ export function matchProductsForFestival(festival, availableProducts) {
   })
 }
 
-export function generateFestivalBundle(festival, products, bundleType = 0) {
+export function generateFestivalBundle(festival, products, bundleType = 0, now = new Date()) {
   const festivalData = FESTIVAL_CALENDAR[festival]
   if (!festivalData || !products.length) return null
 
@@ -277,7 +277,7 @@ export function generateFestivalBundle(festival, products, bundleType = 0) {
     savings: discountAmount,
     margin: bundleIdea.margin,
     whatsappTemplate: generateWhatsAppMessage(festivalData, bundleIdea.name, finalPrice),
-    validUntil: new Date(Date.now() + 30 * 24 * 60 * 60 * 1000) // 30 days
+    validUntil: new Date(now.getTime() + 30 * 24 * 60 * 60 * 1000) // 30 days
   }
 }
 
@@ -314,18 +314,52 @@ ${template.emoji}`,
   }
 }
 
-export function getUpcomingFestivals() {
-  const currentMonth = new Date().getMonth()
+const MONTHS = [
+  'january', 'february', 'march', 'april', 'may', 'june',
+  'july', 'august', 'september', 'october', 'november', 'december'
+]
+
+const UPCOMING_WINDOW_DAYS = 30
+
+// Today's calendar date in a shop's timezone, as UTC midnight
+export function getShopDate(timeZone = 'Asia/Kolkata') {
+  return new Date(new Date().toLocaleDateString('en-CA', { timeZone }))
+}
+
+// Days from `now` until a festival period like 'October-November' starts (0 while
+// it is running), or null for periods without fixed months (lunar calendar).
+// `now` is read as a UTC calendar day: explicit dates such as ?date=2024-10-31
+// parse to UTC midnight, and the default is the shop's local date from getShopDate.
+export function getDaysUntilPeriod(period, now = getShopDate()) {
+  const months = period.toLowerCase().split('-').map(month => MONTHS.indexOf(month.trim()))
+  if (months.some(month => month === -1)) return null
+
+  const first = months[0]
+  const last = months[months.length - 1]
+  const month = now.getUTCMonth()
+  const inPeriod = first <= last
+    ? month >= first && month <= last
+    : month >= first || month <= last
+  if (inPeriod) return 0
+
+  const year = now.getUTCFullYear() + (month > first ? 1 : 0)
+  const today = Date.UTC(now.getUTCFullYear(), month, now.getUTCDate())
+  return Math.round((Date.UTC(year, first, 1) - today) / (24 * 60 * 60 * 1000))
+}
+
+export function getUpcomingFestivals(now = getShopDate()) {
   const festivals = Object.entries(FESTIVAL_CALENDAR)
-  
-  // Simple logic to determine upcoming festivals
-  // In real app, this would use proper date calculations
-  return festivals.map(([key, festival]) => ({
-    key,
-    ...festival,
-    daysUntil: Math.floor(Math.random() * 60) + 1, // Random for demo
-    isUpcoming: Math.random() > 0.5
-  })).sort((a, b) => a.daysUntil - b.daysUntil)
+
+  // Lunar-calendar festivals have no fixed month and sort last
+  return festivals.map(([key, festival]) => {
+    const daysUntil = getDaysUntilPeriod(festival.period, now)
+    return {
+      key,
+      ...festival,
+      daysUntil,
+      isUpcoming: daysUntil !== null && daysUntil <= UPCOMING_WINDOW_DAYS
+    }
+  }).sort((a, b) => (a.daysUntil ?? Infinity) - (b.daysUntil ?? Infinity))
 }
 
 export function generateHyperlocalAlerts(weather, competitors, inventory) {
@@ -0,0 +1,205 @@
+"""
+Unit tests for the change-aware check selection and result cache in backend_test.py
+"""
+
+import pytest
+
+import backend_test
+
+ROUTE_SOURCE = """\
+import { helper } from '@/lib/helpers'
+
+const corsHeaders = { 'Access-Control-Allow-Origin': '*' }
+
+export async function GET(request) {
+  try {
+    if (pathSegments[0] === 'products') {
+      const products = helper()
+      return products
+    }
+
+    if (pathSegments[0] === 'orders') {
+      return []
+    }
+
+    return notFound()
+  } catch (error) {
+    return serverError()
+  }
+}
+
+export async function DELETE(request) {
+  try {
+    if (pathSegments[0] === 'products' || pathSegments[0] === 'orders') {
+      return deleted()
+    }
+  } catch (error) {
+    return serverError()
+  }
+}
+"""
+
+DEPENDENCIES = {
+    'test_products': {'routes': ['GET products', 'DELETE products'], 'libs': []},
+    'test_orders': {'routes': ['GET orders'], 'libs': ['lib/orders.js']},
+    'test_cors': {'routes': [], 'libs': []},
+    'test_not_found': {'routes': ['*'], 'libs': []},
+}
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Minimal repo layout with a route file and two lib modules"""
+    route = tmp_path / backend_test.ROUTE_FILE
+    route.parent.mkdir(parents=True)
+    route.write_text(ROUTE_SOURCE)
+    (tmp_path / 'lib').mkdir()
+    (tmp_path / 'lib' / 'helpers.js').write_text("import { db } from './mongodb'\n")
+    (tmp_path / 'lib' / 'mongodb.js').write_text("export const db = {}\n")
+    (tmp_path / 'lib' / 'orders.js').write_text("export const orders = []\n")
+    monkeypatch.setattr(backend_test, 'REPO_ROOT', str(tmp_path))
+    return tmp_path
+
+
+def fake_git(monkeypatch, changed_files, route_diff="", old_source=ROUTE_SOURCE):
+    """Make backend_test.git return a synthetic diff against `old_source`"""
+    def git(*args):
+        if args[0] == 'show':
+            return old_source
+        if '--name-only' in args:
+            return "\n".join(changed_files)
+        return route_diff
+    monkeypatch.setattr(backend_test, 'git', git)
+
+
+def test_parse_route_branches():
+    branches = backend_test.parse_route_branches(ROUTE_SOURCE)
+
+    assert branches == {
+        'GET products': [(7, 10)],
+        'GET orders': [(12, 14)],
+        'DELETE products': [(24, 26)],
+        'DELETE orders': [(24, 26)],
+    }
+
+
+def test_route_keys_for_lines_marks_shared_code():
+    assert backend_test.route_keys_for_lines(ROUTE_SOURCE, [8]) == {'GET products'}
+    assert backend_test.route_keys_for_lines(ROUTE_SOURCE, [3]) == {'*'}
+    assert backend_test.route_keys_for_lines(ROUTE_SOURCE, [16]) == {'*'}
+
+
+def test_branch_only_change(repo, monkeypatch):
+    fake_git(monkeypatch, [backend_test.ROUTE_FILE], "@@ -8 +8 @@\n-old\n+new\n")
+
+    assert backend_test.changed_since('HEAD') == ({backend_test.ROUTE_FILE}, {'GET products'})
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == [
+        'test_products', 'test_not_found']
+
+
+def test_shared_code_change_selects_everything(repo, monkeypatch):
+    fake_git(monkeypatch, [backend_test.ROUTE_FILE], "@@ -3 +3 @@\n-old\n+new\n")
+
+    assert backend_test.changed_since('HEAD')[1] == {'*'}
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == list(DEPENDENCIES)
+
+
+def test_pure_deletion_hunk(repo, monkeypatch):
+    # Old lines 14-15 sat inside the GET orders branch and were removed
+    old_source = ROUTE_SOURCE.replace("      return []\n", "      return []\n      const a = 1\n      const b = 2\n")
+    fake_git(monkeypatch, [backend_test.ROUTE_FILE], "@@ -14,2 +13,0 @@\n-a\n-b\n", old_source)
+
+    assert backend_test.changed_since('HEAD')[1] == {'GET orders'}
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == [
+        'test_orders', 'test_not_found']
+
+
+def test_renamed_branch_selects_old_key_checks(repo, monkeypatch):
+    route = repo / backend_test.ROUTE_FILE
+    route.write_text(ROUTE_SOURCE.replace("=== 'products') {", "=== 'items') {"))
+    fake_git(monkeypatch, [backend_test.ROUTE_FILE], "@@ -7 +7 @@\n-old\n+new\n")
+
+    assert backend_test.changed_since('HEAD')[1] == {'GET products', 'GET items'}
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == [
+        'test_products', 'test_not_found']
+
+
+def test_deleted_branch_selects_old_key_checks(repo, monkeypatch):
+    route = repo / backend_test.ROUTE_FILE
+    route.write_text(ROUTE_SOURCE.replace("    if (pathSegments[0] === 'orders') {\n      return []\n    }\n", ""))
+    fake_git(monkeypatch, [backend_test.ROUTE_FILE], "@@ -12,3 +11,0 @@\n-a\n-b\n-c\n")
+
+    assert backend_test.changed_since('HEAD')[1] == {'GET orders'}
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == [
+        'test_orders', 'test_not_found']
+
+
+def test_lib_change_selects_direct_and_whole_file_checks(repo, monkeypatch):
+    fake_git(monkeypatch, ['lib/orders.js'])
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == ['test_orders']
+
+    # lib/mongodb.js is only reached through the route's '@/lib/helpers' import
+    fake_git(monkeypatch, ['lib/mongodb.js'])
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == ['test_not_found']
+
+
+def test_runner_change_selects_everything(repo, monkeypatch):
+    fake_git(monkeypatch, ['backend_test.py'])
+
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == list(DEPENDENCIES)
+
+
+@pytest.mark.parametrize('path', backend_test.GLOBAL_FILES)
+def test_global_file_change_selects_everything(repo, monkeypatch, path):
+    fake_git(monkeypatch, [path])
+
+    assert backend_test.select_affected(DEPENDENCIES, 'HEAD', ['backend_test.py']) == list(DEPENDENCIES)
+
+
+def test_global_file_change_invalidates_fingerprints(repo):
+    before = backend_test.dependency_fingerprint(DEPENDENCIES['test_cors'])
+    (repo / 'next.config.js').write_text("module.exports = {}\n")
+
+    assert backend_test.dependency_fingerprint(DEPENDENCIES['test_cors']) != before
+
+
+def test_dependency_map_covers_every_check():
+    assert sorted(backend_test.check_methods(backend_test.SmartLocalAPITester)) == sorted(
+        backend_test.TEST_DEPENDENCIES)
+
+
+def test_fingerprint_ignores_unrelated_branches(repo):
+    route = repo / backend_test.ROUTE_FILE
+    products = backend_test.dependency_fingerprint(DEPENDENCIES['test_products'])
+    orders = backend_test.dependency_fingerprint(DEPENDENCIES['test_orders'])
+
+    route.write_text(ROUTE_SOURCE.replace("return []", "return ['o1']"))
+
+    assert backend_test.dependency_fingerprint(DEPENDENCIES['test_products']) == products
+    assert backend_test.dependency_fingerprint(DEPENDENCIES['test_orders']) != orders
+
+
+def test_result_cache_invalidated_after_failure(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = backend_test.ResultCache(path)
+    cache.record('test_products', 'abc', True)
+    cache.save()
+
+    cache = backend_test.ResultCache(path)
+    assert cache.is_fresh('test_products', 'abc')
+    assert not cache.is_fresh('test_products', 'def')
+    assert cache.cached_result('test_products') is None
+
+    cache.record('test_products', 'abc', False)
+    cache.save()
+
+    assert not backend_test.ResultCache(path).is_fresh('test_products', 'abc')
+
+
+def test_result_cache_keeps_results(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = backend_test.ResultCache(path)
+    cache.record('demand_radar', 'abc', True, {'requests': 10, 'p50_ms': 4.2})
+    cache.save()
+
+    assert backend_test.ResultCache(path).cached_result('demand_radar') == {'requests': 10, 'p50_ms': 4.2}
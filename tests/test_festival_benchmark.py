@@ -0,0 +1,46 @@
+"""
+Unit tests for the reference calculations in backend_benchmark.py
+"""
+
+import argparse
+from datetime import date
+
+import pytest
+
+import backend_benchmark
+
+
+@pytest.mark.parametrize('period, day, expected', [
+    ('January', date(2026, 12, 15), 17),
+    ('March', date(2026, 12, 15), 76),
+    ('September-October', date(2026, 12, 15), 260),
+    ('October-November', date(2026, 12, 15), 290),
+    ('March', date(2026, 2, 20), 9),
+    ('January', date(2027, 1, 1), 0),
+    ('October-November', date(2026, 11, 30), 0),
+    ('September-October', date(2026, 10, 5), 0),
+    ('January', date(2026, 2, 1), 334),
+    ('Based on Lunar Calendar', date(2026, 12, 15), None),
+])
+def test_expected_days_until(period, day, expected):
+    assert backend_benchmark.expected_days_until(period, day) == expected
+
+
+def test_percentile_is_nearest_rank():
+    assert backend_benchmark.percentile([1, 2, 3, 4, 5], 50) == 3
+    assert backend_benchmark.percentile(list(range(1, 21)), 95) == 19
+    assert backend_benchmark.percentile([7], 95) == 7
+
+
+def test_simulated_dates_cover_the_year():
+    dates = backend_benchmark.FestivalBenchmark.simulated_dates(2026, 7)
+
+    assert dates[0] == date(2026, 1, 1)
+    assert dates[-1] == date(2026, 12, 31)
+    assert len(dates) == 53
+
+
+def test_positive_int_rejects_zero():
+    with pytest.raises(argparse.ArgumentTypeError):
+        backend_benchmark.positive_int('0')
+    assert backend_benchmark.positive_int('3') == 3